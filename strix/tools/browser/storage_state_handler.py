@@ -1,56 +1,71 @@
+import asyncio
 import json
 import logging
 from pathlib import Path
+from typing import Any, TypedDict
 
 from playwright.async_api import BrowserContext
 
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_SAME_SITE_MAP = {
+    "lax": "Lax",
+    "strict": "Strict",
+    "none": "None",
+    "no_restriction": "None",
+    "unspecified": "Lax",
+    "": "Lax",
+}
+
+
+class PlaywrightCookie(TypedDict):
+    # Values other than sameSite are passed through from the source file as-is
+    name: Any
+    value: Any
+    domain: Any
+    path: Any
+    httpOnly: Any
+    secure: Any
+    expires: Any
+    sameSite: str
+
 
 class StorageStateHandler:
     """Handle storage state import/export with auto-format detection"""
 
     @staticmethod
-    def _normalize_cookie(cookie: dict) -> dict:
+    def _normalize_cookie(cookie: dict[str, Any]) -> PlaywrightCookie:
         """Normalize cookie to Playwright format"""
-        normalized = {
-            "name": cookie.get("name", ""),
-            "value": cookie.get("value", ""),
-            "domain": cookie.get("domain", ""),
-            "path": cookie.get("path", "/"),
-            "httpOnly": cookie.get("httpOnly", False),
-            "secure": cookie.get("secure", False),
-        }
-
         # Handle expiration date (different field names in different formats)
-        expires = cookie.get("expires", cookie.get("expirationDate", -1))
+        expires = cookie["expires"] if "expires" in cookie else cookie.get("expirationDate", -1)
         if isinstance(expires, str) and expires.isdigit():
             expires = int(expires)
         elif isinstance(expires, float):
             expires = int(expires)
-        normalized["expires"] = expires if expires != 0 else -1
 
         # Handle sameSite (case normalization and common aliases)
         same_site = cookie.get("sameSite")
         if isinstance(same_site, str):
-            normalized_same_site = same_site.strip().lower()
-            if not normalized_same_site:
-                normalized["sameSite"] = "Lax"
-            else:
-                same_site_map = {
-                    "lax": "Lax",
-                    "strict": "Strict",
-                    "none": "None",
-                    "no_restriction": "None",
-                    "unspecified": "Lax",
-                }
-                normalized["sameSite"] = same_site_map.get(
-                    normalized_same_site, same_site.capitalize()
-                )
+            same_site = _SAME_SITE_MAP.get(same_site.strip().lower(), same_site.capitalize())
         else:
-            normalized["sameSite"] = "Lax"
+            same_site = "Lax"
 
-        return normalized
+        return {
+            "name": cookie.get("name", ""),
+            "value": cookie.get("value", ""),
+            "domain": cookie.get("domain", ""),
+            "path": cookie.get("path", "/"),
+            "httpOnly": cookie.get("httpOnly", False),
+            "secure": cookie.get("secure", False),
+            "expires": expires if expires != 0 else -1,
+            "sameSite": same_site,
+        }
 
     @staticmethod
     def _detect_format(data: dict | list) -> str:
@@ -62,31 +77,23 @@ class StorageStateHandler:
             - "cookie_array": Cookie-Editor/EditThisCookie array format
             - "unknown": Unknown format
         """
-        # Check if it's already Playwright format
-        if isinstance(data, dict):
-            if "cookies" in data and isinstance(data.get("cookies"), list):
+        match data:
+            # Already Playwright format
+            case {"cookies": list()}:
                 logger.info("Detected format: Playwright storage_state")
                 return "playwright"
-
-        # Check if it's a cookie array (Cookie-Editor, EditThisCookie, etc.)
-        if isinstance(data, list):
-            if len(data) > 0 and isinstance(data[0], dict):
-                # Check for cookie fields
-                first_item = data[0]
-                if "name" in first_item and "value" in first_item:
-                    logger.info("Detected format: Cookie array (Cookie-Editor/EditThisCookie)")
-                    return "cookie_array"
-
-        logger.warning("Unknown cookie format")
-        return "unknown"
+            # Cookie array (Cookie-Editor, EditThisCookie, etc.)
+            case [{"name": _, "value": _}, *_]:
+                logger.info("Detected format: Cookie array (Cookie-Editor/EditThisCookie)")
+                return "cookie_array"
+            case _:
+                logger.warning("Unknown cookie format")
+                return "unknown"
 
     @staticmethod
     def _convert_cookie_array_to_playwright(cookies: list) -> dict:
         """Convert cookie array format to Playwright format"""
-        normalized_cookies = [
-            StorageStateHandler._normalize_cookie(cookie)
-            for cookie in cookies
-        ]
+        normalized_cookies = list(map(StorageStateHandler._normalize_cookie, cookies))
 
         return {
             "cookies": normalized_cookies,
@@ -100,10 +107,9 @@ class StorageStateHandler:
 
         if format_type == "playwright":
             # Already in Playwright format, just normalize cookies
-            normalized_cookies = [
-                StorageStateHandler._normalize_cookie(cookie)
-                for cookie in data.get("cookies", [])
-            ]
+            normalized_cookies = list(
+                map(StorageStateHandler._normalize_cookie, data.get("cookies", []))
+            )
             return {
                 "cookies": normalized_cookies,
                 "origins": data.get("origins", [])
@@ -123,6 +129,18 @@ class StorageStateHandler:
                 "  - JSON array of cookies"
             )
 
+    @staticmethod
+    def _read_json_file(path: Path) -> Any:
+        """Read and parse a JSON file (blocking; run off the event loop)"""
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+    @staticmethod
+    def _write_json_file(path: Path, obj: Any) -> None:
+        """Serialize and write a JSON file (blocking; run off the event loop)"""
+        data = orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+        path.write_bytes(data)
+
     @staticmethod
     async def load_storage_state(state_path: str) -> dict:
         """
@@ -142,8 +160,7 @@ class StorageStateHandler:
         logger.info(f"Loading storage state from: {state_path}")
 
         try:
-            with open(path) as f:
-                raw_data = json.load(f)
+            raw_data = await asyncio.to_thread(StorageStateHandler._read_json_file, path)
 
             # Auto-detect and convert to Playwright format
             state = StorageStateHandler._auto_convert_to_playwright(raw_data)
@@ -171,11 +188,8 @@ class StorageStateHandler:
 
         try:
             # Playwright's storage_state() returns dict containing cookies and origins
-            await context.storage_state(path=state_path)
-
-            # Read and verify
-            with open(state_path) as f:
-                state = json.load(f)
+            state = await context.storage_state()
+            await asyncio.to_thread(StorageStateHandler._write_json_file, Path(state_path), state)
 
             cookies_count = len(state.get("cookies", []))
             logger.info(f"Saved storage state with {cookies_count} cookies")
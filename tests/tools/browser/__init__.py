@@ -0,0 +1 @@
+"""Tests for strix.tools.browser module."""
@@ -0,0 +1,52 @@
+"""Tests for strix.tools.browser.browser_config."""
+
+from pathlib import Path
+
+import pytest
+
+from strix.tools.browser.browser_config import BrowserConfig
+
+
+class TestBrowserConfigFromPath:
+    """Tests for BrowserConfig.from_path path resolution."""
+
+    def test_relative_path_follows_current_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a relative path resolves against the cwd at call time."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert BrowserConfig.from_path("state.json").storage_state_path == str(first / "state.json")
+
+        monkeypatch.chdir(second)
+        assert BrowserConfig.from_path("state.json").storage_state_path == str(
+            second / "state.json"
+        )
+
+    def test_home_path_follows_home_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a ~ path resolves against HOME at call time."""
+        monkeypatch.setenv("HOME", str(tmp_path / "x"))
+        assert BrowserConfig.from_path("~/s.json").storage_state_path == str(
+            tmp_path / "x" / "s.json"
+        )
+
+        monkeypatch.setenv("HOME", str(tmp_path / "y"))
+        assert BrowserConfig.from_path("~/s.json").storage_state_path == str(
+            tmp_path / "y" / "s.json"
+        )
+
+    def test_env_var_used_when_no_path_given(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the session env var is read on each call."""
+        monkeypatch.setenv(BrowserConfig.SESSION_ENV_VAR, str(tmp_path / "a.json"))
+        assert BrowserConfig.from_path().storage_state_path == str(tmp_path / "a.json")
+
+        monkeypatch.delenv(BrowserConfig.SESSION_ENV_VAR)
+        assert BrowserConfig.from_path().storage_state_path is None